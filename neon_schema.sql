@@ -1,6 +1,7 @@
--- Extensiones (UUID)
+-- Extensiones (UUID, búsqueda por trigramas)
 create extension if not exists "pgcrypto";
 create extension if not exists "uuid-ossp";
+create extension if not exists pg_trgm;
 
 -- Tablas
 create table if not exists public.patients (
@@ -46,6 +47,8 @@ create table if not exists public.appointments (
 create index if not exists idx_appt_date on public.appointments(date);
 create index if not exists idx_appt_prof on public.appointments(professional_id);
 create index if not exists idx_appt_patient on public.appointments(patient_id);
+create index if not exists idx_appt_prof_date_start on public.appointments(professional_id, date, start_time);
+create index if not exists idx_patients_name_trgm on public.patients using gin (full_name gin_trgm_ops);
 
 -- Trigger opcional: precio por defecto desde services
 create or replace function set_appointment_price()